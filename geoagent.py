@@ -200,7 +200,7 @@ class GeoAgent:
 
         for action in self.actions:
             self.iface.removePluginMenu(
-                self.tr(u'&Geo Agent'),
+                self.menu,
                 action)
             self.iface.removeToolBarIcon(action)
         # remove the toolbar